@@ -24,9 +24,61 @@ static const char* kHeader =
     "# be found in the LICENSE file.\n"
     "\n"
     "# This file is automatically generated by mkgrokdump and should not\n"
-    "# be modified manually.\n"
-    "\n"
-    "# List of known V8 instance types.\n";
+    "# be modified manually.\n";
+
+// Helpers used by the generated tables below.
+//
+// All names in the tables are C++ identifiers and are written as plain string
+// literals, which CPython interns when compiling the module, so consumers can
+// rely on the names being interned. Don't wrap them in calls such as
+// sys.intern: that is redundant, and it would add a call per name to every
+// import of the module.
+static const char* kHelpers = R"python(
+
+def _by_space_and_offset(tables):
+  """Merges per-space tables into one dict keyed by (space, offset)."""
+  return dict(((space, offset), value)
+              for space, table in tables.items()
+              for offset, value in table.items())
+
+
+# Reverse indexes by name, built on first use by the functions below.
+_instance_types_by_name = None
+_known_maps_by_name = None
+
+
+def instance_type_for_name(name):
+  """Returns the instance type id called name, or None."""
+  global _instance_types_by_name
+  if _instance_types_by_name is None:
+    _instance_types_by_name = {
+        type_name: instance_type
+        for instance_type, type_name in INSTANCE_TYPES.items()}
+  return _instance_types_by_name.get(name)
+
+
+def known_map_for_name(name):
+  """Returns the (space, offset) key of the known map called name, or None."""
+  global _known_maps_by_name
+  if _known_maps_by_name is None:
+    _known_maps_by_name = {
+        map_name: key
+        for key, (_, map_name) in KNOWN_MAPS.items()}
+  return _known_maps_by_name.get(name)
+
+
+def lookup_map(space, offset):
+  """Returns (instance type, name) of the known map at offset, or None."""
+  maps = KNOWN_MAPS_BY_SPACE.get(space)
+  return maps.get(offset) if maps is not None else None
+
+
+def lookup_object(space, offset):
+  """Returns the name of the known object at offset, or None."""
+  objects = KNOWN_OBJECTS_BY_SPACE.get(space)
+  return objects.get(offset) if objects is not None else None
+
+)python";
 
 // Debug builds emit debug code, affecting code object sizes.
 #ifndef DEBUG
@@ -42,8 +94,7 @@ class MockArrayBufferAllocator : public v8::ArrayBuffer::Allocator {
   void Free(void* p, size_t) override {}
 };
 
-static void DumpKnownMap(FILE* out, i::Heap* heap, const char* space_name,
-                         i::HeapObject object) {
+static void DumpKnownMap(FILE* out, i::Heap* heap, i::HeapObject object) {
 #define RO_ROOT_LIST_CASE(type, name, CamelName) \
   if (root_name == nullptr && object == roots.name()) root_name = #CamelName;
 #define MUTABLE_ROOT_LIST_CASE(type, name, CamelName) \
@@ -59,15 +110,14 @@ static void DumpKnownMap(FILE* out, i::Heap* heap, const char* space_name,
   MUTABLE_ROOT_LIST(MUTABLE_ROOT_LIST_CASE)
 
   if (root_name == nullptr) return;
-  i::PrintF(out, "  (\"%s\", 0x%05" V8PRIxPTR "): (%d, \"%s\"),\n", space_name,
-            root_ptr, map.instance_type(), root_name);
+  i::PrintF(out, "    0x%05" V8PRIxPTR ": (%d, \"%s\"),\n", root_ptr,
+            map.instance_type(), root_name);
 
 #undef MUTABLE_ROOT_LIST_CASE
 #undef RO_ROOT_LIST_CASE
 }
 
-static void DumpKnownObject(FILE* out, i::Heap* heap, const char* space_name,
-                            i::HeapObject object) {
+static void DumpKnownObject(FILE* out, i::Heap* heap, i::HeapObject object) {
 #define RO_ROOT_LIST_CASE(type, name, CamelName)        \
   if (root_name == nullptr && object == roots.name()) { \
     root_name = #CamelName;                             \
@@ -90,8 +140,7 @@ static void DumpKnownObject(FILE* out, i::Heap* heap, const char* space_name,
   if (root_name == nullptr) return;
   if (!i::RootsTable::IsImmortalImmovable(root_index)) return;
 
-  i::PrintF(out, "  (\"%s\", 0x%05" V8PRIxPTR "): \"%s\",\n", space_name,
-            root_ptr, root_name);
+  i::PrintF(out, "    0x%05" V8PRIxPTR ": \"%s\",\n", root_ptr, root_name);
 
 #undef ROOT_LIST_CASE
 #undef RO_ROOT_LIST_CASE
@@ -133,6 +182,8 @@ static int DumpHeapConstants(FILE* out, const char* argv0) {
     i::ReadOnlyHeap* read_only_heap =
         reinterpret_cast<i::Isolate*>(isolate)->read_only_heap();
     i::PrintF(out, "%s", kHeader);
+    i::PrintF(out, "%s", kHelpers);
+    i::PrintF(out, "\n# List of known V8 instance types.\n");
 #define DUMP_TYPE(T) i::PrintF(out, "  %d: \"%s\",\n", i::T, #T);
     i::PrintF(out, "INSTANCE_TYPES = {\n");
     INSTANCE_TYPE_LIST(DUMP_TYPE)
@@ -142,36 +193,41 @@ static int DumpHeapConstants(FILE* out, const char* argv0) {
     {
       // Dump the KNOWN_MAP table to the console.
       i::PrintF(out, "\n# List of known V8 maps.\n");
-      i::PrintF(out, "KNOWN_MAPS = {\n");
+      i::PrintF(out, "KNOWN_MAPS_BY_SPACE = {\n");
+      i::PrintF(out, "  \"%s\": {\n", i::BaseSpace::GetSpaceName(i::RO_SPACE));
       i::ReadOnlyHeapObjectIterator ro_iterator(read_only_heap);
       for (i::HeapObject object = ro_iterator.Next(); !object.is_null();
            object = ro_iterator.Next()) {
         if (!object.IsMap()) continue;
-        DumpKnownMap(out, heap, i::BaseSpace::GetSpaceName(i::RO_SPACE),
-                     object);
+        DumpKnownMap(out, heap, object);
       }
+      i::PrintF(out, "  },\n");
+      i::PrintF(out, "  \"%s\": {\n", i::BaseSpace::GetSpaceName(i::MAP_SPACE));
       i::PagedSpaceObjectIterator iterator(heap, heap->map_space());
       for (i::HeapObject object = iterator.Next(); !object.is_null();
            object = iterator.Next()) {
         if (!object.IsMap()) continue;
-        DumpKnownMap(out, heap, i::BaseSpace::GetSpaceName(i::MAP_SPACE),
-                     object);
+        DumpKnownMap(out, heap, object);
       }
+      i::PrintF(out, "  },\n");
       i::PrintF(out, "}\n");
+      i::PrintF(out, "KNOWN_MAPS = _by_space_and_offset("
+                     "KNOWN_MAPS_BY_SPACE)\n");
     }
 
     {
       // Dump the KNOWN_OBJECTS table to the console.
       i::PrintF(out, "\n# List of known V8 objects.\n");
-      i::PrintF(out, "KNOWN_OBJECTS = {\n");
+      i::PrintF(out, "KNOWN_OBJECTS_BY_SPACE = {\n");
+      i::PrintF(out, "  \"%s\": {\n", i::BaseSpace::GetSpaceName(i::RO_SPACE));
       i::ReadOnlyHeapObjectIterator ro_iterator(read_only_heap);
       for (i::HeapObject object = ro_iterator.Next(); !object.is_null();
            object = ro_iterator.Next()) {
         // Skip read-only heap maps, they will be reported elsewhere.
         if (object.IsMap()) continue;
-        DumpKnownObject(out, heap, i::BaseSpace::GetSpaceName(i::RO_SPACE),
-                        object);
+        DumpKnownObject(out, heap, object);
       }
+      i::PrintF(out, "  },\n");
 
       i::PagedSpaceIterator spit(heap);
       for (i::PagedSpace* s = spit.Next(); s != nullptr; s = spit.Next()) {
@@ -179,12 +235,15 @@ static int DumpHeapConstants(FILE* out, const char* argv0) {
         // Code objects are generally platform-dependent.
         if (s->identity() == i::CODE_SPACE || s->identity() == i::MAP_SPACE)
           continue;
-        const char* sname = s->name();
+        i::PrintF(out, "  \"%s\": {\n", s->name());
         for (i::HeapObject o = it.Next(); !o.is_null(); o = it.Next()) {
-          DumpKnownObject(out, heap, sname, o);
+          DumpKnownObject(out, heap, o);
         }
+        i::PrintF(out, "  },\n");
       }
       i::PrintF(out, "}\n");
+      i::PrintF(out, "KNOWN_OBJECTS = _by_space_and_offset("
+                     "KNOWN_OBJECTS_BY_SPACE)\n");
     }
 
     if (COMPRESS_POINTERS_BOOL) {
@@ -217,6 +276,10 @@ static int DumpHeapConstants(FILE* out, const char* argv0) {
     STACK_FRAME_TYPE_LIST(DUMP_MARKER)
     i::PrintF(out, ")\n");
 #undef DUMP_MARKER
+    i::PrintF(out, "\n# Position of each frame marker above, by name.\n");
+    i::PrintF(out, "FRAME_MARKER_INDEX = dict(\n");
+    i::PrintF(out, "    (name, index) for index, name in "
+                   "enumerate(FRAME_MARKERS))\n");
   }
 
   i::PrintF(out, "\n# This set of constants is generated from a %s build.\n",
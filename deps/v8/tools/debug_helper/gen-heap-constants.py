@@ -27,12 +27,12 @@ namespace debug_helper_internal {
 def iterate_objects(target_space, camel_space_name):
   global out
   result = []
-  for (space, offset), (instance_type, name) in v8heapconst.KNOWN_MAPS.items():
-    if space == target_space:
-      result.append((offset, name))
-  for (space, offset), name in v8heapconst.KNOWN_OBJECTS.items():
-    if space == target_space:
-      result.append((offset, name))
+  known_maps = v8heapconst.KNOWN_MAPS_BY_SPACE.get(target_space, {})
+  for offset, (instance_type, name) in known_maps.items():
+    result.append((offset, name))
+  known_objects = v8heapconst.KNOWN_OBJECTS_BY_SPACE.get(target_space, {})
+  for offset, name in known_objects.items():
+    result.append((offset, name))
   out = out + '\nstd::string FindKnownObjectIn' + camel_space_name \
       + '(uintptr_t offset) {\n  switch (offset) {\n'
   for offset, name in result:
@@ -47,10 +47,10 @@ def iterate_maps(target_space, camel_space_name):
   global out
   out = out + '\nint FindKnownMapInstanceTypeIn' + camel_space_name \
       + '(uintptr_t offset) {\n  switch (offset) {\n'
-  for (space, offset), (instance_type, name) in v8heapconst.KNOWN_MAPS.items():
-    if space == target_space:
-      out = out + '    case ' + str(offset) + ': return ' + str(instance_type) \
-          + ';\n'
+  known_maps = v8heapconst.KNOWN_MAPS_BY_SPACE.get(target_space, {})
+  for offset, (instance_type, name) in known_maps.items():
+    out = out + '    case ' + str(offset) + ': return ' + str(instance_type) \
+        + ';\n'
   out = out + '    default: return -1;\n  }\n}\n'
 
 iterate_maps('map_space', 'MapSpace')
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# Copyright 2022 the V8 project authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# Checks the helpers that mkgrokdump emits into tools/v8heapconst.py against
+# the checked-in tables.
+
+import os
+import sys
+import unittest
+
+TOOLS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, TOOLS_DIR)
+
+import v8heapconst
+
+
+class V8HeapConstTest(unittest.TestCase):
+  def test_known_maps_match_per_space_tables(self):
+    expected = {}
+    for space, maps in v8heapconst.KNOWN_MAPS_BY_SPACE.items():
+      for offset, value in maps.items():
+        expected[(space, offset)] = value
+    self.assertIs(dict, type(v8heapconst.KNOWN_MAPS))
+    self.assertEqual(expected, v8heapconst.KNOWN_MAPS)
+
+  def test_known_objects_match_per_space_tables(self):
+    expected = {}
+    for space, objects in v8heapconst.KNOWN_OBJECTS_BY_SPACE.items():
+      for offset, name in objects.items():
+        expected[(space, offset)] = name
+    self.assertIs(dict, type(v8heapconst.KNOWN_OBJECTS))
+    self.assertEqual(expected, v8heapconst.KNOWN_OBJECTS)
+
+  def test_lookup_map(self):
+    for (space, offset), value in v8heapconst.KNOWN_MAPS.items():
+      self.assertEqual(value, v8heapconst.lookup_map(space, offset))
+    self.assertIsNone(v8heapconst.lookup_map('read_only_space', 0))
+    self.assertIsNone(v8heapconst.lookup_map('no_such_space', 0x02119))
+    self.assertIsNone(v8heapconst.lookup_map(None, None))
+
+  def test_lookup_object(self):
+    for (space, offset), name in v8heapconst.KNOWN_OBJECTS.items():
+      self.assertEqual(name, v8heapconst.lookup_object(space, offset))
+    self.assertIsNone(v8heapconst.lookup_object('old_space', 0))
+    self.assertIsNone(v8heapconst.lookup_object('no_such_space', 0x021b9))
+    self.assertIsNone(v8heapconst.lookup_object(None, None))
+
+  def test_misses_on_odd_keys(self):
+    for table in (v8heapconst.INSTANCE_TYPES, v8heapconst.KNOWN_MAPS,
+                  v8heapconst.KNOWN_OBJECTS):
+      for key in (None, 'x', 5, -1, ('map_space',), ('MAP_SPACE', 0x02119)):
+        self.assertIsNone(table.get(key))
+        self.assertNotIn(key, table)
+
+  def test_instance_type_for_name(self):
+    self.assertIs(dict, type(v8heapconst.INSTANCE_TYPES))
+    for instance_type, name in v8heapconst.INSTANCE_TYPES.items():
+      self.assertEqual(instance_type, v8heapconst.instance_type_for_name(name))
+    self.assertIsNone(v8heapconst.instance_type_for_name('NO_SUCH_TYPE'))
+    self.assertIsNone(v8heapconst.instance_type_for_name(None))
+
+  def test_known_map_for_name(self):
+    for key, (_, name) in v8heapconst.KNOWN_MAPS.items():
+      self.assertEqual(key, v8heapconst.known_map_for_name(name))
+    self.assertIsNone(v8heapconst.known_map_for_name('NoSuchMap'))
+
+  def test_frame_marker_index(self):
+    self.assertEqual(len(v8heapconst.FRAME_MARKERS),
+                     len(v8heapconst.FRAME_MARKER_INDEX))
+    for index, name in enumerate(v8heapconst.FRAME_MARKERS):
+      self.assertEqual(index, v8heapconst.FRAME_MARKER_INDEX[name])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -5,6 +5,51 @@
 # This file is automatically generated by mkgrokdump and should not
 # be modified manually.
 
+
+def _by_space_and_offset(tables):
+  """Merges per-space tables into one dict keyed by (space, offset)."""
+  return dict(((space, offset), value)
+              for space, table in tables.items()
+              for offset, value in table.items())
+
+
+# Reverse indexes by name, built on first use by the functions below.
+_instance_types_by_name = None
+_known_maps_by_name = None
+
+
+def instance_type_for_name(name):
+  """Returns the instance type id called name, or None."""
+  global _instance_types_by_name
+  if _instance_types_by_name is None:
+    _instance_types_by_name = {
+        type_name: instance_type
+        for instance_type, type_name in INSTANCE_TYPES.items()}
+  return _instance_types_by_name.get(name)
+
+
+def known_map_for_name(name):
+  """Returns the (space, offset) key of the known map called name, or None."""
+  global _known_maps_by_name
+  if _known_maps_by_name is None:
+    _known_maps_by_name = {
+        map_name: key
+        for key, (_, map_name) in KNOWN_MAPS.items()}
+  return _known_maps_by_name.get(name)
+
+
+def lookup_map(space, offset):
+  """Returns (instance type, name) of the known map at offset, or None."""
+  maps = KNOWN_MAPS_BY_SPACE.get(space)
+  return maps.get(offset) if maps is not None else None
+
+
+def lookup_object(space, offset):
+  """Returns the name of the known object at offset, or None."""
+  objects = KNOWN_OBJECTS_BY_SPACE.get(space)
+  return objects.get(offset) if objects is not None else None
+
+
 # List of known V8 instance types.
 INSTANCE_TYPES = {
   0: "INTERNALIZED_STRING_TYPE",
@@ -257,279 +302,289 @@ INSTANCE_TYPES = {
 }
 
 # List of known V8 maps.
-KNOWN_MAPS = {
-  ("read_only_space", 0x02119): (243, "MetaMap"),
-  ("read_only_space", 0x02141): (131, "NullMap"),
-  ("read_only_space", 0x02169): (224, "StrongDescriptorArrayMap"),
-  ("read_only_space", 0x02191): (229, "WeakFixedArrayMap"),
-  ("read_only_space", 0x021d1): (156, "EnumCacheMap"),
-  ("read_only_space", 0x02205): (176, "FixedArrayMap"),
-  ("read_only_space", 0x02251): (8, "OneByteInternalizedStringMap"),
-  ("read_only_space", 0x0229d): (240, "FreeSpaceMap"),
-  ("read_only_space", 0x022c5): (239, "OnePointerFillerMap"),
-  ("read_only_space", 0x022ed): (239, "TwoPointerFillerMap"),
-  ("read_only_space", 0x02315): (131, "UninitializedMap"),
-  ("read_only_space", 0x0238d): (131, "UndefinedMap"),
-  ("read_only_space", 0x023d1): (130, "HeapNumberMap"),
-  ("read_only_space", 0x02405): (131, "TheHoleMap"),
-  ("read_only_space", 0x02465): (131, "BooleanMap"),
-  ("read_only_space", 0x02509): (189, "ByteArrayMap"),
-  ("read_only_space", 0x02531): (176, "FixedCOWArrayMap"),
-  ("read_only_space", 0x02559): (177, "HashTableMap"),
-  ("read_only_space", 0x02581): (128, "SymbolMap"),
-  ("read_only_space", 0x025a9): (40, "OneByteStringMap"),
-  ("read_only_space", 0x025d1): (249, "ScopeInfoMap"),
-  ("read_only_space", 0x025f9): (250, "SharedFunctionInfoMap"),
-  ("read_only_space", 0x02621): (233, "CodeMap"),
-  ("read_only_space", 0x02649): (232, "CellMap"),
-  ("read_only_space", 0x02671): (248, "GlobalPropertyCellMap"),
-  ("read_only_space", 0x02699): (204, "ForeignMap"),
-  ("read_only_space", 0x026c1): (230, "TransitionArrayMap"),
-  ("read_only_space", 0x026e9): (45, "ThinOneByteStringMap"),
-  ("read_only_space", 0x02711): (238, "FeedbackVectorMap"),
-  ("read_only_space", 0x02749): (131, "ArgumentsMarkerMap"),
-  ("read_only_space", 0x027a9): (131, "ExceptionMap"),
-  ("read_only_space", 0x02805): (131, "TerminationExceptionMap"),
-  ("read_only_space", 0x0286d): (131, "OptimizedOutMap"),
-  ("read_only_space", 0x028cd): (131, "StaleRegisterMap"),
-  ("read_only_space", 0x0292d): (188, "ScriptContextTableMap"),
-  ("read_only_space", 0x02955): (186, "ClosureFeedbackCellArrayMap"),
-  ("read_only_space", 0x0297d): (237, "FeedbackMetadataArrayMap"),
-  ("read_only_space", 0x029a5): (176, "ArrayListMap"),
-  ("read_only_space", 0x029cd): (129, "BigIntMap"),
-  ("read_only_space", 0x029f5): (187, "ObjectBoilerplateDescriptionMap"),
-  ("read_only_space", 0x02a1d): (190, "BytecodeArrayMap"),
-  ("read_only_space", 0x02a45): (234, "CodeDataContainerMap"),
-  ("read_only_space", 0x02a6d): (235, "CoverageInfoMap"),
-  ("read_only_space", 0x02a95): (191, "FixedDoubleArrayMap"),
-  ("read_only_space", 0x02abd): (179, "GlobalDictionaryMap"),
-  ("read_only_space", 0x02ae5): (157, "ManyClosuresCellMap"),
-  ("read_only_space", 0x02b0d): (244, "MegaDomHandlerMap"),
-  ("read_only_space", 0x02b35): (176, "ModuleInfoMap"),
-  ("read_only_space", 0x02b5d): (180, "NameDictionaryMap"),
-  ("read_only_space", 0x02b85): (157, "NoClosuresCellMap"),
-  ("read_only_space", 0x02bad): (181, "NumberDictionaryMap"),
-  ("read_only_space", 0x02bd5): (157, "OneClosureCellMap"),
-  ("read_only_space", 0x02bfd): (182, "OrderedHashMapMap"),
-  ("read_only_space", 0x02c25): (183, "OrderedHashSetMap"),
-  ("read_only_space", 0x02c4d): (184, "OrderedNameDictionaryMap"),
-  ("read_only_space", 0x02c75): (246, "PreparseDataMap"),
-  ("read_only_space", 0x02c9d): (247, "PropertyArrayMap"),
-  ("read_only_space", 0x02cc5): (153, "SideEffectCallHandlerInfoMap"),
-  ("read_only_space", 0x02ced): (153, "SideEffectFreeCallHandlerInfoMap"),
-  ("read_only_space", 0x02d15): (153, "NextCallSideEffectFreeCallHandlerInfoMap"),
-  ("read_only_space", 0x02d3d): (185, "SimpleNumberDictionaryMap"),
-  ("read_only_space", 0x02d65): (218, "SmallOrderedHashMapMap"),
-  ("read_only_space", 0x02d8d): (219, "SmallOrderedHashSetMap"),
-  ("read_only_space", 0x02db5): (220, "SmallOrderedNameDictionaryMap"),
-  ("read_only_space", 0x02ddd): (225, "SourceTextModuleMap"),
-  ("read_only_space", 0x02e05): (254, "SwissNameDictionaryMap"),
-  ("read_only_space", 0x02e2d): (226, "SyntheticModuleMap"),
-  ("read_only_space", 0x02e55): (206, "WasmCapiFunctionDataMap"),
-  ("read_only_space", 0x02e7d): (207, "WasmExportedFunctionDataMap"),
-  ("read_only_space", 0x02ea5): (208, "WasmJSFunctionDataMap"),
-  ("read_only_space", 0x02ecd): (255, "WasmApiFunctionRefMap"),
-  ("read_only_space", 0x02ef5): (209, "WasmTypeInfoMap"),
-  ("read_only_space", 0x02f1d): (256, "WeakArrayListMap"),
-  ("read_only_space", 0x02f45): (178, "EphemeronHashTableMap"),
-  ("read_only_space", 0x02f6d): (236, "EmbedderDataArrayMap"),
-  ("read_only_space", 0x02f95): (257, "WeakCellMap"),
-  ("read_only_space", 0x02fbd): (32, "StringMap"),
-  ("read_only_space", 0x02fe5): (41, "ConsOneByteStringMap"),
-  ("read_only_space", 0x0300d): (33, "ConsStringMap"),
-  ("read_only_space", 0x03035): (37, "ThinStringMap"),
-  ("read_only_space", 0x0305d): (35, "SlicedStringMap"),
-  ("read_only_space", 0x03085): (43, "SlicedOneByteStringMap"),
-  ("read_only_space", 0x030ad): (34, "ExternalStringMap"),
-  ("read_only_space", 0x030d5): (42, "ExternalOneByteStringMap"),
-  ("read_only_space", 0x030fd): (50, "UncachedExternalStringMap"),
-  ("read_only_space", 0x03125): (0, "InternalizedStringMap"),
-  ("read_only_space", 0x0314d): (2, "ExternalInternalizedStringMap"),
-  ("read_only_space", 0x03175): (10, "ExternalOneByteInternalizedStringMap"),
-  ("read_only_space", 0x0319d): (18, "UncachedExternalInternalizedStringMap"),
-  ("read_only_space", 0x031c5): (26, "UncachedExternalOneByteInternalizedStringMap"),
-  ("read_only_space", 0x031ed): (58, "UncachedExternalOneByteStringMap"),
-  ("read_only_space", 0x03215): (104, "SharedOneByteStringMap"),
-  ("read_only_space", 0x0323d): (96, "SharedStringMap"),
-  ("read_only_space", 0x03265): (131, "SelfReferenceMarkerMap"),
-  ("read_only_space", 0x0328d): (131, "BasicBlockCountersMarkerMap"),
-  ("read_only_space", 0x032d1): (147, "ArrayBoilerplateDescriptionMap"),
-  ("read_only_space", 0x033d1): (159, "InterceptorInfoMap"),
-  ("read_only_space", 0x05c65): (132, "PromiseFulfillReactionJobTaskMap"),
-  ("read_only_space", 0x05c8d): (133, "PromiseRejectReactionJobTaskMap"),
-  ("read_only_space", 0x05cb5): (134, "CallableTaskMap"),
-  ("read_only_space", 0x05cdd): (135, "CallbackTaskMap"),
-  ("read_only_space", 0x05d05): (136, "PromiseResolveThenableJobTaskMap"),
-  ("read_only_space", 0x05d2d): (139, "FunctionTemplateInfoMap"),
-  ("read_only_space", 0x05d55): (140, "ObjectTemplateInfoMap"),
-  ("read_only_space", 0x05d7d): (141, "AccessCheckInfoMap"),
-  ("read_only_space", 0x05da5): (142, "AccessorInfoMap"),
-  ("read_only_space", 0x05dcd): (143, "AccessorPairMap"),
-  ("read_only_space", 0x05df5): (144, "AliasedArgumentsEntryMap"),
-  ("read_only_space", 0x05e1d): (145, "AllocationMementoMap"),
-  ("read_only_space", 0x05e45): (148, "AsmWasmDataMap"),
-  ("read_only_space", 0x05e6d): (149, "AsyncGeneratorRequestMap"),
-  ("read_only_space", 0x05e95): (150, "BreakPointMap"),
-  ("read_only_space", 0x05ebd): (151, "BreakPointInfoMap"),
-  ("read_only_space", 0x05ee5): (152, "CachedTemplateObjectMap"),
-  ("read_only_space", 0x05f0d): (154, "ClassPositionsMap"),
-  ("read_only_space", 0x05f35): (155, "DebugInfoMap"),
-  ("read_only_space", 0x05f5d): (158, "FunctionTemplateRareDataMap"),
-  ("read_only_space", 0x05f85): (160, "InterpreterDataMap"),
-  ("read_only_space", 0x05fad): (161, "ModuleRequestMap"),
-  ("read_only_space", 0x05fd5): (162, "PromiseCapabilityMap"),
-  ("read_only_space", 0x05ffd): (163, "PromiseReactionMap"),
-  ("read_only_space", 0x06025): (164, "PropertyDescriptorObjectMap"),
-  ("read_only_space", 0x0604d): (165, "PrototypeInfoMap"),
-  ("read_only_space", 0x06075): (166, "RegExpBoilerplateDescriptionMap"),
-  ("read_only_space", 0x0609d): (167, "ScriptMap"),
-  ("read_only_space", 0x060c5): (168, "ScriptOrModuleMap"),
-  ("read_only_space", 0x060ed): (169, "SourceTextModuleInfoEntryMap"),
-  ("read_only_space", 0x06115): (170, "StackFrameInfoMap"),
-  ("read_only_space", 0x0613d): (171, "TemplateObjectDescriptionMap"),
-  ("read_only_space", 0x06165): (172, "Tuple2Map"),
-  ("read_only_space", 0x0618d): (173, "WasmContinuationObjectMap"),
-  ("read_only_space", 0x061b5): (174, "WasmExceptionTagMap"),
-  ("read_only_space", 0x061dd): (175, "WasmIndirectFunctionTableMap"),
-  ("read_only_space", 0x06205): (193, "SloppyArgumentsElementsMap"),
-  ("read_only_space", 0x0622d): (223, "DescriptorArrayMap"),
-  ("read_only_space", 0x06255): (228, "UncompiledDataWithoutPreparseDataMap"),
-  ("read_only_space", 0x0627d): (227, "UncompiledDataWithPreparseDataMap"),
-  ("read_only_space", 0x062a5): (245, "OnHeapBasicBlockProfilerDataMap"),
-  ("read_only_space", 0x062cd): (210, "TurbofanBitsetTypeMap"),
-  ("read_only_space", 0x062f5): (214, "TurbofanUnionTypeMap"),
-  ("read_only_space", 0x0631d): (213, "TurbofanRangeTypeMap"),
-  ("read_only_space", 0x06345): (211, "TurbofanHeapConstantTypeMap"),
-  ("read_only_space", 0x0636d): (212, "TurbofanOtherNumberConstantTypeMap"),
-  ("read_only_space", 0x06395): (241, "InternalClassMap"),
-  ("read_only_space", 0x063bd): (252, "SmiPairMap"),
-  ("read_only_space", 0x063e5): (251, "SmiBoxMap"),
-  ("read_only_space", 0x0640d): (215, "ExportedSubClassBaseMap"),
-  ("read_only_space", 0x06435): (216, "ExportedSubClassMap"),
-  ("read_only_space", 0x0645d): (221, "AbstractInternalClassSubclass1Map"),
-  ("read_only_space", 0x06485): (222, "AbstractInternalClassSubclass2Map"),
-  ("read_only_space", 0x064ad): (192, "InternalClassWithSmiElementsMap"),
-  ("read_only_space", 0x064d5): (242, "InternalClassWithStructElementsMap"),
-  ("read_only_space", 0x064fd): (217, "ExportedSubClass2Map"),
-  ("read_only_space", 0x06525): (253, "SortStateMap"),
-  ("read_only_space", 0x0654d): (231, "CallRefDataMap"),
-  ("read_only_space", 0x06575): (146, "AllocationSiteWithWeakNextMap"),
-  ("read_only_space", 0x0659d): (146, "AllocationSiteWithoutWeakNextMap"),
-  ("read_only_space", 0x065c5): (137, "LoadHandler1Map"),
-  ("read_only_space", 0x065ed): (137, "LoadHandler2Map"),
-  ("read_only_space", 0x06615): (137, "LoadHandler3Map"),
-  ("read_only_space", 0x0663d): (138, "StoreHandler0Map"),
-  ("read_only_space", 0x06665): (138, "StoreHandler1Map"),
-  ("read_only_space", 0x0668d): (138, "StoreHandler2Map"),
-  ("read_only_space", 0x066b5): (138, "StoreHandler3Map"),
-  ("map_space", 0x02119): (1057, "ExternalMap"),
-  ("map_space", 0x02141): (2114, "JSMessageObjectMap"),
+KNOWN_MAPS_BY_SPACE = {
+  "read_only_space": {
+    0x02119: (243, "MetaMap"),
+    0x02141: (131, "NullMap"),
+    0x02169: (224, "StrongDescriptorArrayMap"),
+    0x02191: (229, "WeakFixedArrayMap"),
+    0x021d1: (156, "EnumCacheMap"),
+    0x02205: (176, "FixedArrayMap"),
+    0x02251: (8, "OneByteInternalizedStringMap"),
+    0x0229d: (240, "FreeSpaceMap"),
+    0x022c5: (239, "OnePointerFillerMap"),
+    0x022ed: (239, "TwoPointerFillerMap"),
+    0x02315: (131, "UninitializedMap"),
+    0x0238d: (131, "UndefinedMap"),
+    0x023d1: (130, "HeapNumberMap"),
+    0x02405: (131, "TheHoleMap"),
+    0x02465: (131, "BooleanMap"),
+    0x02509: (189, "ByteArrayMap"),
+    0x02531: (176, "FixedCOWArrayMap"),
+    0x02559: (177, "HashTableMap"),
+    0x02581: (128, "SymbolMap"),
+    0x025a9: (40, "OneByteStringMap"),
+    0x025d1: (249, "ScopeInfoMap"),
+    0x025f9: (250, "SharedFunctionInfoMap"),
+    0x02621: (233, "CodeMap"),
+    0x02649: (232, "CellMap"),
+    0x02671: (248, "GlobalPropertyCellMap"),
+    0x02699: (204, "ForeignMap"),
+    0x026c1: (230, "TransitionArrayMap"),
+    0x026e9: (45, "ThinOneByteStringMap"),
+    0x02711: (238, "FeedbackVectorMap"),
+    0x02749: (131, "ArgumentsMarkerMap"),
+    0x027a9: (131, "ExceptionMap"),
+    0x02805: (131, "TerminationExceptionMap"),
+    0x0286d: (131, "OptimizedOutMap"),
+    0x028cd: (131, "StaleRegisterMap"),
+    0x0292d: (188, "ScriptContextTableMap"),
+    0x02955: (186, "ClosureFeedbackCellArrayMap"),
+    0x0297d: (237, "FeedbackMetadataArrayMap"),
+    0x029a5: (176, "ArrayListMap"),
+    0x029cd: (129, "BigIntMap"),
+    0x029f5: (187, "ObjectBoilerplateDescriptionMap"),
+    0x02a1d: (190, "BytecodeArrayMap"),
+    0x02a45: (234, "CodeDataContainerMap"),
+    0x02a6d: (235, "CoverageInfoMap"),
+    0x02a95: (191, "FixedDoubleArrayMap"),
+    0x02abd: (179, "GlobalDictionaryMap"),
+    0x02ae5: (157, "ManyClosuresCellMap"),
+    0x02b0d: (244, "MegaDomHandlerMap"),
+    0x02b35: (176, "ModuleInfoMap"),
+    0x02b5d: (180, "NameDictionaryMap"),
+    0x02b85: (157, "NoClosuresCellMap"),
+    0x02bad: (181, "NumberDictionaryMap"),
+    0x02bd5: (157, "OneClosureCellMap"),
+    0x02bfd: (182, "OrderedHashMapMap"),
+    0x02c25: (183, "OrderedHashSetMap"),
+    0x02c4d: (184, "OrderedNameDictionaryMap"),
+    0x02c75: (246, "PreparseDataMap"),
+    0x02c9d: (247, "PropertyArrayMap"),
+    0x02cc5: (153, "SideEffectCallHandlerInfoMap"),
+    0x02ced: (153, "SideEffectFreeCallHandlerInfoMap"),
+    0x02d15: (153, "NextCallSideEffectFreeCallHandlerInfoMap"),
+    0x02d3d: (185, "SimpleNumberDictionaryMap"),
+    0x02d65: (218, "SmallOrderedHashMapMap"),
+    0x02d8d: (219, "SmallOrderedHashSetMap"),
+    0x02db5: (220, "SmallOrderedNameDictionaryMap"),
+    0x02ddd: (225, "SourceTextModuleMap"),
+    0x02e05: (254, "SwissNameDictionaryMap"),
+    0x02e2d: (226, "SyntheticModuleMap"),
+    0x02e55: (206, "WasmCapiFunctionDataMap"),
+    0x02e7d: (207, "WasmExportedFunctionDataMap"),
+    0x02ea5: (208, "WasmJSFunctionDataMap"),
+    0x02ecd: (255, "WasmApiFunctionRefMap"),
+    0x02ef5: (209, "WasmTypeInfoMap"),
+    0x02f1d: (256, "WeakArrayListMap"),
+    0x02f45: (178, "EphemeronHashTableMap"),
+    0x02f6d: (236, "EmbedderDataArrayMap"),
+    0x02f95: (257, "WeakCellMap"),
+    0x02fbd: (32, "StringMap"),
+    0x02fe5: (41, "ConsOneByteStringMap"),
+    0x0300d: (33, "ConsStringMap"),
+    0x03035: (37, "ThinStringMap"),
+    0x0305d: (35, "SlicedStringMap"),
+    0x03085: (43, "SlicedOneByteStringMap"),
+    0x030ad: (34, "ExternalStringMap"),
+    0x030d5: (42, "ExternalOneByteStringMap"),
+    0x030fd: (50, "UncachedExternalStringMap"),
+    0x03125: (0, "InternalizedStringMap"),
+    0x0314d: (2, "ExternalInternalizedStringMap"),
+    0x03175: (10, "ExternalOneByteInternalizedStringMap"),
+    0x0319d: (18, "UncachedExternalInternalizedStringMap"),
+    0x031c5: (26, "UncachedExternalOneByteInternalizedStringMap"),
+    0x031ed: (58, "UncachedExternalOneByteStringMap"),
+    0x03215: (104, "SharedOneByteStringMap"),
+    0x0323d: (96, "SharedStringMap"),
+    0x03265: (131, "SelfReferenceMarkerMap"),
+    0x0328d: (131, "BasicBlockCountersMarkerMap"),
+    0x032d1: (147, "ArrayBoilerplateDescriptionMap"),
+    0x033d1: (159, "InterceptorInfoMap"),
+    0x05c65: (132, "PromiseFulfillReactionJobTaskMap"),
+    0x05c8d: (133, "PromiseRejectReactionJobTaskMap"),
+    0x05cb5: (134, "CallableTaskMap"),
+    0x05cdd: (135, "CallbackTaskMap"),
+    0x05d05: (136, "PromiseResolveThenableJobTaskMap"),
+    0x05d2d: (139, "FunctionTemplateInfoMap"),
+    0x05d55: (140, "ObjectTemplateInfoMap"),
+    0x05d7d: (141, "AccessCheckInfoMap"),
+    0x05da5: (142, "AccessorInfoMap"),
+    0x05dcd: (143, "AccessorPairMap"),
+    0x05df5: (144, "AliasedArgumentsEntryMap"),
+    0x05e1d: (145, "AllocationMementoMap"),
+    0x05e45: (148, "AsmWasmDataMap"),
+    0x05e6d: (149, "AsyncGeneratorRequestMap"),
+    0x05e95: (150, "BreakPointMap"),
+    0x05ebd: (151, "BreakPointInfoMap"),
+    0x05ee5: (152, "CachedTemplateObjectMap"),
+    0x05f0d: (154, "ClassPositionsMap"),
+    0x05f35: (155, "DebugInfoMap"),
+    0x05f5d: (158, "FunctionTemplateRareDataMap"),
+    0x05f85: (160, "InterpreterDataMap"),
+    0x05fad: (161, "ModuleRequestMap"),
+    0x05fd5: (162, "PromiseCapabilityMap"),
+    0x05ffd: (163, "PromiseReactionMap"),
+    0x06025: (164, "PropertyDescriptorObjectMap"),
+    0x0604d: (165, "PrototypeInfoMap"),
+    0x06075: (166, "RegExpBoilerplateDescriptionMap"),
+    0x0609d: (167, "ScriptMap"),
+    0x060c5: (168, "ScriptOrModuleMap"),
+    0x060ed: (169, "SourceTextModuleInfoEntryMap"),
+    0x06115: (170, "StackFrameInfoMap"),
+    0x0613d: (171, "TemplateObjectDescriptionMap"),
+    0x06165: (172, "Tuple2Map"),
+    0x0618d: (173, "WasmContinuationObjectMap"),
+    0x061b5: (174, "WasmExceptionTagMap"),
+    0x061dd: (175, "WasmIndirectFunctionTableMap"),
+    0x06205: (193, "SloppyArgumentsElementsMap"),
+    0x0622d: (223, "DescriptorArrayMap"),
+    0x06255: (228, "UncompiledDataWithoutPreparseDataMap"),
+    0x0627d: (227, "UncompiledDataWithPreparseDataMap"),
+    0x062a5: (245, "OnHeapBasicBlockProfilerDataMap"),
+    0x062cd: (210, "TurbofanBitsetTypeMap"),
+    0x062f5: (214, "TurbofanUnionTypeMap"),
+    0x0631d: (213, "TurbofanRangeTypeMap"),
+    0x06345: (211, "TurbofanHeapConstantTypeMap"),
+    0x0636d: (212, "TurbofanOtherNumberConstantTypeMap"),
+    0x06395: (241, "InternalClassMap"),
+    0x063bd: (252, "SmiPairMap"),
+    0x063e5: (251, "SmiBoxMap"),
+    0x0640d: (215, "ExportedSubClassBaseMap"),
+    0x06435: (216, "ExportedSubClassMap"),
+    0x0645d: (221, "AbstractInternalClassSubclass1Map"),
+    0x06485: (222, "AbstractInternalClassSubclass2Map"),
+    0x064ad: (192, "InternalClassWithSmiElementsMap"),
+    0x064d5: (242, "InternalClassWithStructElementsMap"),
+    0x064fd: (217, "ExportedSubClass2Map"),
+    0x06525: (253, "SortStateMap"),
+    0x0654d: (231, "CallRefDataMap"),
+    0x06575: (146, "AllocationSiteWithWeakNextMap"),
+    0x0659d: (146, "AllocationSiteWithoutWeakNextMap"),
+    0x065c5: (137, "LoadHandler1Map"),
+    0x065ed: (137, "LoadHandler2Map"),
+    0x06615: (137, "LoadHandler3Map"),
+    0x0663d: (138, "StoreHandler0Map"),
+    0x06665: (138, "StoreHandler1Map"),
+    0x0668d: (138, "StoreHandler2Map"),
+    0x066b5: (138, "StoreHandler3Map"),
+  },
+  "map_space": {
+    0x02119: (1057, "ExternalMap"),
+    0x02141: (2114, "JSMessageObjectMap"),
+  },
 }
+KNOWN_MAPS = _by_space_and_offset(KNOWN_MAPS_BY_SPACE)
 
 # List of known V8 objects.
-KNOWN_OBJECTS = {
-  ("read_only_space", 0x021b9): "EmptyWeakFixedArray",
-  ("read_only_space", 0x021c1): "EmptyDescriptorArray",
-  ("read_only_space", 0x021f9): "EmptyEnumCache",
-  ("read_only_space", 0x0222d): "EmptyFixedArray",
-  ("read_only_space", 0x02235): "NullValue",
-  ("read_only_space", 0x0233d): "UninitializedValue",
-  ("read_only_space", 0x023b5): "UndefinedValue",
-  ("read_only_space", 0x023f9): "NanValue",
-  ("read_only_space", 0x0242d): "TheHoleValue",
-  ("read_only_space", 0x02459): "HoleNanValue",
-  ("read_only_space", 0x0248d): "TrueValue",
-  ("read_only_space", 0x024cd): "FalseValue",
-  ("read_only_space", 0x024fd): "empty_string",
-  ("read_only_space", 0x02739): "EmptyScopeInfo",
-  ("read_only_space", 0x02771): "ArgumentsMarker",
-  ("read_only_space", 0x027d1): "Exception",
-  ("read_only_space", 0x0282d): "TerminationException",
-  ("read_only_space", 0x02895): "OptimizedOut",
-  ("read_only_space", 0x028f5): "StaleRegister",
-  ("read_only_space", 0x032b5): "EmptyPropertyArray",
-  ("read_only_space", 0x032bd): "EmptyByteArray",
-  ("read_only_space", 0x032c5): "EmptyObjectBoilerplateDescription",
-  ("read_only_space", 0x032f9): "EmptyArrayBoilerplateDescription",
-  ("read_only_space", 0x03305): "EmptyClosureFeedbackCellArray",
-  ("read_only_space", 0x0330d): "EmptySlowElementDictionary",
-  ("read_only_space", 0x03331): "EmptyOrderedHashMap",
-  ("read_only_space", 0x03345): "EmptyOrderedHashSet",
-  ("read_only_space", 0x03359): "EmptyFeedbackMetadata",
-  ("read_only_space", 0x03365): "EmptyPropertyDictionary",
-  ("read_only_space", 0x0338d): "EmptyOrderedPropertyDictionary",
-  ("read_only_space", 0x033a5): "EmptySwissPropertyDictionary",
-  ("read_only_space", 0x033f9): "NoOpInterceptorInfo",
-  ("read_only_space", 0x03421): "EmptyWeakArrayList",
-  ("read_only_space", 0x0342d): "InfinityValue",
-  ("read_only_space", 0x03439): "MinusZeroValue",
-  ("read_only_space", 0x03445): "MinusInfinityValue",
-  ("read_only_space", 0x03451): "SelfReferenceMarker",
-  ("read_only_space", 0x03491): "BasicBlockCountersMarker",
-  ("read_only_space", 0x034d5): "OffHeapTrampolineRelocationInfo",
-  ("read_only_space", 0x034e1): "TrampolineTrivialCodeDataContainer",
-  ("read_only_space", 0x034ed): "TrampolinePromiseRejectionCodeDataContainer",
-  ("read_only_space", 0x034f9): "GlobalThisBindingScopeInfo",
-  ("read_only_space", 0x03529): "EmptyFunctionScopeInfo",
-  ("read_only_space", 0x0354d): "NativeScopeInfo",
-  ("read_only_space", 0x03565): "HashSeed",
-  ("old_space", 0x04211): "ArgumentsIteratorAccessor",
-  ("old_space", 0x04255): "ArrayLengthAccessor",
-  ("old_space", 0x04299): "BoundFunctionLengthAccessor",
-  ("old_space", 0x042dd): "BoundFunctionNameAccessor",
-  ("old_space", 0x04321): "ErrorStackAccessor",
-  ("old_space", 0x04365): "FunctionArgumentsAccessor",
-  ("old_space", 0x043a9): "FunctionCallerAccessor",
-  ("old_space", 0x043ed): "FunctionNameAccessor",
-  ("old_space", 0x04431): "FunctionLengthAccessor",
-  ("old_space", 0x04475): "FunctionPrototypeAccessor",
-  ("old_space", 0x044b9): "StringLengthAccessor",
-  ("old_space", 0x044fd): "InvalidPrototypeValidityCell",
-  ("old_space", 0x04505): "EmptyScript",
-  ("old_space", 0x04545): "ManyClosuresCell",
-  ("old_space", 0x04551): "ArrayConstructorProtector",
-  ("old_space", 0x04565): "NoElementsProtector",
-  ("old_space", 0x04579): "MegaDOMProtector",
-  ("old_space", 0x0458d): "IsConcatSpreadableProtector",
-  ("old_space", 0x045a1): "ArraySpeciesProtector",
-  ("old_space", 0x045b5): "TypedArraySpeciesProtector",
-  ("old_space", 0x045c9): "PromiseSpeciesProtector",
-  ("old_space", 0x045dd): "RegExpSpeciesProtector",
-  ("old_space", 0x045f1): "StringLengthProtector",
-  ("old_space", 0x04605): "ArrayIteratorProtector",
-  ("old_space", 0x04619): "ArrayBufferDetachingProtector",
-  ("old_space", 0x0462d): "PromiseHookProtector",
-  ("old_space", 0x04641): "PromiseResolveProtector",
-  ("old_space", 0x04655): "MapIteratorProtector",
-  ("old_space", 0x04669): "PromiseThenProtector",
-  ("old_space", 0x0467d): "SetIteratorProtector",
-  ("old_space", 0x04691): "StringIteratorProtector",
-  ("old_space", 0x046a5): "SingleCharacterStringCache",
-  ("old_space", 0x04aad): "StringSplitCache",
-  ("old_space", 0x04eb5): "RegExpMultipleCache",
-  ("old_space", 0x052bd): "BuiltinsConstantsTable",
-  ("old_space", 0x056e5): "AsyncFunctionAwaitRejectSharedFun",
-  ("old_space", 0x05709): "AsyncFunctionAwaitResolveSharedFun",
-  ("old_space", 0x0572d): "AsyncGeneratorAwaitRejectSharedFun",
-  ("old_space", 0x05751): "AsyncGeneratorAwaitResolveSharedFun",
-  ("old_space", 0x05775): "AsyncGeneratorYieldResolveSharedFun",
-  ("old_space", 0x05799): "AsyncGeneratorReturnResolveSharedFun",
-  ("old_space", 0x057bd): "AsyncGeneratorReturnClosedRejectSharedFun",
-  ("old_space", 0x057e1): "AsyncGeneratorReturnClosedResolveSharedFun",
-  ("old_space", 0x05805): "AsyncIteratorValueUnwrapSharedFun",
-  ("old_space", 0x05829): "PromiseAllResolveElementSharedFun",
-  ("old_space", 0x0584d): "PromiseAllSettledResolveElementSharedFun",
-  ("old_space", 0x05871): "PromiseAllSettledRejectElementSharedFun",
-  ("old_space", 0x05895): "PromiseAnyRejectElementSharedFun",
-  ("old_space", 0x058b9): "PromiseCapabilityDefaultRejectSharedFun",
-  ("old_space", 0x058dd): "PromiseCapabilityDefaultResolveSharedFun",
-  ("old_space", 0x05901): "PromiseCatchFinallySharedFun",
-  ("old_space", 0x05925): "PromiseGetCapabilitiesExecutorSharedFun",
-  ("old_space", 0x05949): "PromiseThenFinallySharedFun",
-  ("old_space", 0x0596d): "PromiseThrowerFinallySharedFun",
-  ("old_space", 0x05991): "PromiseValueThunkFinallySharedFun",
-  ("old_space", 0x059b5): "ProxyRevokeSharedFun",
+KNOWN_OBJECTS_BY_SPACE = {
+  "read_only_space": {
+    0x021b9: "EmptyWeakFixedArray",
+    0x021c1: "EmptyDescriptorArray",
+    0x021f9: "EmptyEnumCache",
+    0x0222d: "EmptyFixedArray",
+    0x02235: "NullValue",
+    0x0233d: "UninitializedValue",
+    0x023b5: "UndefinedValue",
+    0x023f9: "NanValue",
+    0x0242d: "TheHoleValue",
+    0x02459: "HoleNanValue",
+    0x0248d: "TrueValue",
+    0x024cd: "FalseValue",
+    0x024fd: "empty_string",
+    0x02739: "EmptyScopeInfo",
+    0x02771: "ArgumentsMarker",
+    0x027d1: "Exception",
+    0x0282d: "TerminationException",
+    0x02895: "OptimizedOut",
+    0x028f5: "StaleRegister",
+    0x032b5: "EmptyPropertyArray",
+    0x032bd: "EmptyByteArray",
+    0x032c5: "EmptyObjectBoilerplateDescription",
+    0x032f9: "EmptyArrayBoilerplateDescription",
+    0x03305: "EmptyClosureFeedbackCellArray",
+    0x0330d: "EmptySlowElementDictionary",
+    0x03331: "EmptyOrderedHashMap",
+    0x03345: "EmptyOrderedHashSet",
+    0x03359: "EmptyFeedbackMetadata",
+    0x03365: "EmptyPropertyDictionary",
+    0x0338d: "EmptyOrderedPropertyDictionary",
+    0x033a5: "EmptySwissPropertyDictionary",
+    0x033f9: "NoOpInterceptorInfo",
+    0x03421: "EmptyWeakArrayList",
+    0x0342d: "InfinityValue",
+    0x03439: "MinusZeroValue",
+    0x03445: "MinusInfinityValue",
+    0x03451: "SelfReferenceMarker",
+    0x03491: "BasicBlockCountersMarker",
+    0x034d5: "OffHeapTrampolineRelocationInfo",
+    0x034e1: "TrampolineTrivialCodeDataContainer",
+    0x034ed: "TrampolinePromiseRejectionCodeDataContainer",
+    0x034f9: "GlobalThisBindingScopeInfo",
+    0x03529: "EmptyFunctionScopeInfo",
+    0x0354d: "NativeScopeInfo",
+    0x03565: "HashSeed",
+  },
+  "old_space": {
+    0x04211: "ArgumentsIteratorAccessor",
+    0x04255: "ArrayLengthAccessor",
+    0x04299: "BoundFunctionLengthAccessor",
+    0x042dd: "BoundFunctionNameAccessor",
+    0x04321: "ErrorStackAccessor",
+    0x04365: "FunctionArgumentsAccessor",
+    0x043a9: "FunctionCallerAccessor",
+    0x043ed: "FunctionNameAccessor",
+    0x04431: "FunctionLengthAccessor",
+    0x04475: "FunctionPrototypeAccessor",
+    0x044b9: "StringLengthAccessor",
+    0x044fd: "InvalidPrototypeValidityCell",
+    0x04505: "EmptyScript",
+    0x04545: "ManyClosuresCell",
+    0x04551: "ArrayConstructorProtector",
+    0x04565: "NoElementsProtector",
+    0x04579: "MegaDOMProtector",
+    0x0458d: "IsConcatSpreadableProtector",
+    0x045a1: "ArraySpeciesProtector",
+    0x045b5: "TypedArraySpeciesProtector",
+    0x045c9: "PromiseSpeciesProtector",
+    0x045dd: "RegExpSpeciesProtector",
+    0x045f1: "StringLengthProtector",
+    0x04605: "ArrayIteratorProtector",
+    0x04619: "ArrayBufferDetachingProtector",
+    0x0462d: "PromiseHookProtector",
+    0x04641: "PromiseResolveProtector",
+    0x04655: "MapIteratorProtector",
+    0x04669: "PromiseThenProtector",
+    0x0467d: "SetIteratorProtector",
+    0x04691: "StringIteratorProtector",
+    0x046a5: "SingleCharacterStringCache",
+    0x04aad: "StringSplitCache",
+    0x04eb5: "RegExpMultipleCache",
+    0x052bd: "BuiltinsConstantsTable",
+    0x056e5: "AsyncFunctionAwaitRejectSharedFun",
+    0x05709: "AsyncFunctionAwaitResolveSharedFun",
+    0x0572d: "AsyncGeneratorAwaitRejectSharedFun",
+    0x05751: "AsyncGeneratorAwaitResolveSharedFun",
+    0x05775: "AsyncGeneratorYieldResolveSharedFun",
+    0x05799: "AsyncGeneratorReturnResolveSharedFun",
+    0x057bd: "AsyncGeneratorReturnClosedRejectSharedFun",
+    0x057e1: "AsyncGeneratorReturnClosedResolveSharedFun",
+    0x05805: "AsyncIteratorValueUnwrapSharedFun",
+    0x05829: "PromiseAllResolveElementSharedFun",
+    0x0584d: "PromiseAllSettledResolveElementSharedFun",
+    0x05871: "PromiseAllSettledRejectElementSharedFun",
+    0x05895: "PromiseAnyRejectElementSharedFun",
+    0x058b9: "PromiseCapabilityDefaultRejectSharedFun",
+    0x058dd: "PromiseCapabilityDefaultResolveSharedFun",
+    0x05901: "PromiseCatchFinallySharedFun",
+    0x05925: "PromiseGetCapabilitiesExecutorSharedFun",
+    0x05949: "PromiseThenFinallySharedFun",
+    0x0596d: "PromiseThrowerFinallySharedFun",
+    0x05991: "PromiseValueThunkFinallySharedFun",
+    0x059b5: "ProxyRevokeSharedFun",
+  },
 }
+KNOWN_OBJECTS = _by_space_and_offset(KNOWN_OBJECTS_BY_SPACE)
 
 # Lower 32 bits of first page addresses for various heap spaces.
 HEAP_FIRST_PAGES = {
@@ -565,4 +620,8 @@ FRAME_MARKERS = (
   "NATIVE",
 )
 
+# Position of each frame marker above, by name.
+FRAME_MARKER_INDEX = dict(
+    (name, index) for index, name in enumerate(FRAME_MARKERS))
+
 # This set of constants is generated from a shipping build.